@@ -14,102 +14,187 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import contextlib
+import functools
+import io
 import json
-import os
-import re
-import tempfile
-from typing import Dict, List, Optional, Set
+import sys
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Set, Tuple
+import gecko_profile_generator
 from gecko_profile_generator import Category, StackFrame
 
 from . test_utils import TestBase, TestHelper
 
+# orjson and ujson parse and serialize the large golden profiles several times
+# faster than stdlib json. Both are optional: fall back to stdlib json when
+# they aren't installed.
+try:
+    import orjson
+except ModuleNotFoundError:
+    orjson = None
+try:
+    import ujson
+except ModuleNotFoundError:
+    ujson = None
+
+if orjson:
+    _json_loads = orjson.loads
+elif ujson:
+    _json_loads = ujson.loads
+else:
+    _json_loads = json.loads
+
+
+def _canonical_json(value: Any) -> bytes:
+    """ Serialize value with sorted keys, to compare profiles as bytes. """
+    if orjson:
+        return orjson.dumps(value, option=orjson.OPT_SORT_KEYS)
+    return json.dumps(value, sort_keys=True).encode('utf-8')
+
+
+@functools.lru_cache(maxsize=None)
+def _load_golden(golden_path: str) -> Dict:
+    """ Read and parse a golden file once per test session. """
+    return _json_loads(Path(golden_path).read_bytes())
+
+
+@functools.lru_cache(maxsize=None)
+def _load_golden_canonical(golden_path: str) -> bytes:
+    """ Canonical serialization of a golden file, cached per test session. """
+    return _canonical_json(_load_golden(golden_path))
+
+
+# Expected Category for each StackFrame, evaluated in one batch by
+# test_categories.
+_CATEGORY_CASES = (
+    (StackFrame("do_translation_fault", "[kernel.kallsyms]"), Category.KERNEL),
+    (StackFrame("ufshcd_queuecommand", "/vendor/lib/modules/ufshcd-core.ko"), Category.KERNEL),
+    (StackFrame("pread64", "/apex/com.android.runtime/lib64/bionic/libc.so"), Category.NATIVE),
+    (StackFrame("sqlite3_step", "/data/app/~~wuHphp3RYz860st7j_csbg==/com.google.android.apps.maps-Ly1kpqXI4YEFCsPE36jq5A==/split_config.arm64_v8a.apk!/lib/arm64-v8a/libgmm-jni.so"), Category.NATIVE),
+    (StackFrame("__schedule", "[kernel.kallsyms]"), Category.OFF_CPU),
+    # b/362131906 regression: Collection.sort was classified as NATIVE
+    # due to having .so substring.
+    (StackFrame("java.util.Collections.sort", "/data/misc/apexdata/com.android.art/dalvik-cache/arm64/boot.oat"), Category.OAT),
+    (StackFrame("java.util.ArrayList.sort", "/data/misc/apexdata/com.android.art/dalvik-cache/arm64/boot.oat"), Category.OAT),
+    (StackFrame("java.lang.Thread.run", "/data/misc/apexdata/com.android.art/dalvik-cache/arm64/boot.oat"), Category.OAT),
+    (StackFrame("art_quick_alloc_object_initialized_region_tlab", "/apex/com.android.art/lib64/libart.so"), Category.NATIVE),
+    (StackFrame("java.lang.System.arraycopy", "/apex/com.android.art/javalib/core-oj.jar"), Category.DEX),
+    (StackFrame("com.google.protobuf.MessageSchema.parseMessage", "/data/app/~~wuHphp3RYz860st7j_csbg==/com.google.android.apps.maps-Ly1kpqXI4YEFCsPE36jq5A==/oat/arm64/base.odex"), Category.OAT),
+    (StackFrame("art_quick_invoke_stub", "/apex/com.android.art/lib64/libart.so"), Category.NATIVE),
+    (StackFrame("android.net.NetworkInfo.<init>", "[JIT app cache]"), Category.JIT),
+    (StackFrame("unknown", "noextension"), Category.USER),
+)
+
 
 class TestGeckoProfileGenerator(TestBase):
+    # The generator output for a given input is stable within a test session.
+    # Share it between tests instead of re-running the generator: several tests
+    # use the same (testdata_file, options) pair, and the generator run
+    # dominates their wall time.
+    _generator_output_cache: Dict[Tuple[str, Tuple[str, ...]], str] = {}
+    _parsed_profile_cache: Dict[Tuple[str, Tuple[str, ...]], Dict] = {}
+
     def run_generator(self, testdata_file: str, options: Optional[List[str]] = None) -> str:
-        testdata_path = TestHelper.testdata_path(testdata_file)
-        args = ['gecko_profile_generator.py', '-i', testdata_path]
-        if options:
-            args.extend(options)
-        return self.run_cmd(args, return_output=True)
+        key = (testdata_file, tuple(options) if options else ())
+        output = self._generator_output_cache.get(key)
+        if output is None:
+            testdata_path = TestHelper.testdata_path(testdata_file)
+            argv = ['gecko_profile_generator.py', '-i', testdata_path]
+            if options:
+                argv.extend(options)
+            # Run the generator in this process instead of spawning a child
+            # interpreter: startup and module imports cost more than generating
+            # the smaller profiles.
+            stdout = io.StringIO()
+            saved_argv = sys.argv
+            sys.argv = argv
+            try:
+                with contextlib.redirect_stdout(stdout):
+                    gecko_profile_generator.main()
+            finally:
+                sys.argv = saved_argv
+            output = stdout.getvalue()
+            self._generator_output_cache[key] = output
+        return output
 
     def generate_profile(self, testdata_file: str, options: Optional[List[str]] = None) -> Dict:
-        output = self.run_generator(testdata_file, options)
-        return json.loads(output)
+        # Cache parsed profiles as well: test_remove_gaps and
+        # test_sample_filters only traverse them, so repeated calls shouldn't
+        # pay for another full JSON parse. Callers must not mutate the result.
+        key = (testdata_file, tuple(options) if options else ())
+        profile = self._parsed_profile_cache.get(key)
+        if profile is None:
+            profile = _json_loads(self.run_generator(testdata_file, options))
+            self._parsed_profile_cache[key] = profile
+        return profile
+
+    def check_golden(self, testdata_file: str, golden_file: str):
+        output = self.run_generator(testdata_file, ['--remove-gaps', '0'])
+        golden_path = TestHelper.testdata_path(golden_file)
+        # Golden data is stored in canonical form: sorted keys, 2-space indent.
+        # Regenerate golden data by running:
+        # $ ./gecko_profile_generator.py --remove-gaps 0 -i ../testdata/<testdata_file> | python3 -m json.tool --sort-keys --indent 2 > test/script_testdata/<golden_file>
+        got = _json_loads(output)
+        got_bytes = _canonical_json(got)
+        want_bytes = _load_golden_canonical(golden_path)
+        if got_bytes == want_bytes:
+            # Matching profiles reduce to a single C-level bytes comparison.
+            return
+        # Fall back to the parsed dicts for a readable failure diff.
+        self.assertEqual(got, _load_golden(golden_path))
+        self.assertEqual(got_bytes, want_bytes)
 
     def test_golden(self):
-        output = self.run_generator('perf_with_interpreter_frames.data', ['--remove-gaps', '0'])
-        got = json.loads(output)
-        golden_path = TestHelper.testdata_path('perf_with_interpreter_frames.gecko.json')
-        with open(golden_path) as f:
-            want = json.load(f)
-        # Golden data is formatted with `jq` tool (https://stedolan.github.io/jq/).
-        # Regenerate golden data by running:
-        # $ apt install jq
-        # $ ./gecko_profile_generator.py --remove-gaps 0 -i ../testdata/perf_with_interpreter_frames.data | jq > test/script_testdata/perf_with_interpreter_frames.gecko.json
-        self.assertEqual(
-            json.dumps(got, sort_keys=True, indent=2),
-            json.dumps(want, sort_keys=True, indent=2))
+        self.check_golden('perf_with_interpreter_frames.data',
+                          'perf_with_interpreter_frames.gecko.json')
 
     def test_golden_offcpu(self):
-        output = self.run_generator('perf_with_tracepoint_event.data', ['--remove-gaps', '0'])
-        got = json.loads(output)
-        golden_path = TestHelper.testdata_path('perf_with_tracepoint_event.gecko.json')
-        with open(golden_path) as f:
-            want = json.load(f)
-        # Golden data is formatted with `jq` tool (https://stedolan.github.io/jq/).
-        # Regenerate golden data by running:
-        # $ apt install jq
-        # $ ./gecko_profile_generator.py --remove-gaps 0 -i ../testdata/perf_with_tracepoint_event.data | jq > test/script_testdata/perf_with_tracepoint_event.gecko.json
-        self.assertEqual(
-            json.dumps(got, sort_keys=True, indent=2),
-            json.dumps(want, sort_keys=True, indent=2))
+        self.check_golden('perf_with_tracepoint_event.data',
+                          'perf_with_tracepoint_event.gecko.json')
 
     def test_golden_jit(self):
-        output = self.run_generator('perf_with_jit_symbol.data', ['--remove-gaps', '0'])
-        got = json.loads(output)
-        golden_path = TestHelper.testdata_path('perf_with_jit_symbol.gecko.json')
-        with open(golden_path) as f:
-            want = json.load(f)
-        # Golden data is formatted with `jq` tool (https://stedolan.github.io/jq/).
-        # Regenerate golden data by running:
-        # $ apt install jq
-        # $ ./gecko_profile_generator.py --remove-gaps 0 -i ../testdata/perf_with_jit_symbol.data | jq > test/script_testdata/perf_with_jit_symbol.gecko.json
-        self.assertEqual(
-            json.dumps(got, sort_keys=True, indent=2),
-            json.dumps(want, sort_keys=True, indent=2))
+        self.check_golden('perf_with_jit_symbol.data', 'perf_with_jit_symbol.gecko.json')
 
     def test_sample_filters(self):
         def get_threads_for_filter(filter: str) -> Set[int]:
-            report = self.run_generator('perf_display_bitmaps.data',
-                                        filter.split() + ['--remove-gaps', '0'])
-            pattern = re.compile(r'"tid":\s+(\d+),')
-            threads = set()
-            for m in re.finditer(pattern, report):
-                threads.add(int(m.group(1)))
-            return threads
-
-        self.assertNotIn(31850, get_threads_for_filter('--exclude-pid 31850'))
-        self.assertIn(31850, get_threads_for_filter('--include-pid 31850'))
-        self.assertIn(31850, get_threads_for_filter('--pid 31850'))
-        self.assertNotIn(31881, get_threads_for_filter('--exclude-tid 31881'))
-        self.assertIn(31881, get_threads_for_filter('--include-tid 31881'))
-        self.assertIn(31881, get_threads_for_filter('--tid 31881'))
-        self.assertNotIn(31881, get_threads_for_filter(
-            '--exclude-process-name com.example.android.displayingbitmaps'))
-        self.assertIn(31881, get_threads_for_filter(
-            '--include-process-name com.example.android.displayingbitmaps'))
-        self.assertNotIn(31850, get_threads_for_filter(
-            '--exclude-thread-name com.example.android.displayingbitmaps'))
-        self.assertIn(31850, get_threads_for_filter(
-            '--include-thread-name com.example.android.displayingbitmaps'))
-
-        with tempfile.NamedTemporaryFile('w', delete=False) as filter_file:
+            profile = self.generate_profile('perf_display_bitmaps.data',
+                                            filter.split() + ['--remove-gaps', '0'])
+            return {thread['tid'] for thread in profile['threads']}
+
+        # (filter, tid, whether tid should show up under the filter).
+        expectations = (
+            ('--exclude-pid 31850', 31850, False),
+            ('--include-pid 31850', 31850, True),
+            ('--pid 31850', 31850, True),
+            ('--exclude-tid 31881', 31881, False),
+            ('--include-tid 31881', 31881, True),
+            ('--tid 31881', 31881, True),
+            ('--exclude-process-name com.example.android.displayingbitmaps', 31881, False),
+            ('--include-process-name com.example.android.displayingbitmaps', 31881, True),
+            ('--exclude-thread-name com.example.android.displayingbitmaps', 31850, False),
+            ('--include-thread-name com.example.android.displayingbitmaps', 31850, True),
+        )
+        # Materialize the filter -> tids mapping once, then each assertion is
+        # a set lookup.
+        threads_for_filter = {
+            filter: get_threads_for_filter(filter) for filter, _, _ in expectations}
+        for filter, tid, expect_in in expectations:
+            with self.subTest(filter=filter):
+                if expect_in:
+                    self.assertIn(tid, threads_for_filter[filter])
+                else:
+                    self.assertNotIn(tid, threads_for_filter[filter])
+
+        # Write the filter file in self.test_dir, which the test harness cleans
+        # up, instead of leaking a NamedTemporaryFile created with delete=False
+        # when the test fails before the manual unlink.
+        filter_file_path = str(self.test_dir / 'filter_file.txt')
+        with open(filter_file_path, 'w') as filter_file:
             filter_file.write('GLOBAL_BEGIN 684943449406175\nGLOBAL_END 684943449406176')
-            filter_file.flush()
-            threads = get_threads_for_filter('--filter-file ' + filter_file.name)
-            self.assertIn(31881, threads)
-            self.assertNotIn(31850, threads)
-        os.unlink(filter_file.name)
+        threads = get_threads_for_filter('--filter-file ' + filter_file_path)
+        self.assertIn(31881, threads)
+        self.assertNotIn(31850, threads)
 
     def test_show_art_frames(self):
         art_frame_str = 'art::interpreter::DoCall'
@@ -133,24 +218,5 @@ class TestGeckoProfileGenerator(TestBase):
         self.assertEqual(4032, get_sample_count(['--remove-gaps', '0']))
 
     def test_categories(self):
-        want = [
-            (StackFrame("do_translation_fault", "[kernel.kallsyms]"), Category.KERNEL),
-            (StackFrame("ufshcd_queuecommand", "/vendor/lib/modules/ufshcd-core.ko"), Category.KERNEL),
-            (StackFrame("pread64", "/apex/com.android.runtime/lib64/bionic/libc.so"), Category.NATIVE),
-            (StackFrame("sqlite3_step", "/data/app/~~wuHphp3RYz860st7j_csbg==/com.google.android.apps.maps-Ly1kpqXI4YEFCsPE36jq5A==/split_config.arm64_v8a.apk!/lib/arm64-v8a/libgmm-jni.so"), Category.NATIVE),
-            (StackFrame("__schedule", "[kernel.kallsyms]"), Category.OFF_CPU),
-            # b/362131906 regression: Collection.sort was classified as NATIVE
-            # due to having .so substring.
-            (StackFrame("java.util.Collections.sort", "/data/misc/apexdata/com.android.art/dalvik-cache/arm64/boot.oat"), Category.OAT),
-            (StackFrame("java.util.ArrayList.sort", "/data/misc/apexdata/com.android.art/dalvik-cache/arm64/boot.oat"), Category.OAT),
-            (StackFrame("java.lang.Thread.run", "/data/misc/apexdata/com.android.art/dalvik-cache/arm64/boot.oat"), Category.OAT),
-            (StackFrame("art_quick_alloc_object_initialized_region_tlab", "/apex/com.android.art/lib64/libart.so"), Category.NATIVE),
-            (StackFrame("java.lang.System.arraycopy", "/apex/com.android.art/javalib/core-oj.jar"), Category.DEX),
-            (StackFrame("com.google.protobuf.MessageSchema.parseMessage", "/data/app/~~wuHphp3RYz860st7j_csbg==/com.google.android.apps.maps-Ly1kpqXI4YEFCsPE36jq5A==/oat/arm64/base.odex"), Category.OAT),
-            (StackFrame("art_quick_invoke_stub", "/apex/com.android.art/lib64/libart.so"), Category.NATIVE),
-            (StackFrame("android.net.NetworkInfo.<init>", "[JIT app cache]"), Category.JIT),
-            (StackFrame("unknown", "noextension"), Category.USER),
-        ]
-        got = [(testcase[0], testcase[0].category()) for testcase in want]
-
-        self.assertEqual(want, got)
+        got = tuple((frame, frame.category()) for frame, _ in _CATEGORY_CASES)
+        self.assertEqual(_CATEGORY_CASES, got)
@@ -0,0 +1,126 @@
+#
+# Copyright (C) 2024 The Android Open Source Project
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+"""Unit tests for AppStartupCommandExecutor."""
+
+import copy
+import unittest
+from tests.executor_test_common import (
+    ExecutorTestCase, FakeAdbDevice, TEST_ERROR_MSG, TEST_EXCEPTION,
+    TEST_PACKAGE_1, TEST_PACKAGE_2, TEST_PACKAGE_3, TEST_VALIDATION_ERROR,
+    make_profiler_command)
+
+
+class AppStartupExecutorUnitTest(ExecutorTestCase):
+
+  @classmethod
+  def setUpClass(cls):
+    cls.command_template = make_profiler_command(
+        "app-startup", app=TEST_PACKAGE_1)
+
+  def setUp(self):
+    self.command = copy.copy(self.command_template)
+    self.mock_device = FakeAdbDevice()
+    self.mock_device.get_packages.return_value = [TEST_PACKAGE_1,
+                                                  TEST_PACKAGE_2]
+    self.mock_device.is_package_running.return_value = False
+
+  def test_app_startup_command_success(self):
+    self.mock_device.start_package.return_value = None
+
+    error = self.command.execute(self.mock_device)
+
+    self.assertIsNone(error)
+    self.assertEqual(self.mock_device.start_package.call_count, 1)
+    self.assertEqual(self.mock_device.force_stop_package.call_count, 1)
+    self.assertEqual(self.mock_device.pull_file.call_count, 1)
+
+  def test_start_package_failure(self):
+    self.mock_device.start_package.side_effect = TEST_EXCEPTION
+
+    self.assert_execute_raises_test_error(0)
+    self.assertEqual(self.mock_device.start_package.call_count, 1)
+    self.assertEqual(self.mock_device.force_stop_package.call_count, 0)
+
+  def test_get_packages_failure(self):
+    self.mock_device.get_packages.side_effect = TEST_EXCEPTION
+
+    self.assert_execute_raises_test_error(0)
+    self.assertEqual(self.mock_device.start_package.call_count, 0)
+
+  def test_package_does_not_exist_failure(self):
+    self.mock_device.get_packages.return_value = [TEST_PACKAGE_2,
+                                                  TEST_PACKAGE_3]
+
+    error = self.command.execute(self.mock_device)
+
+    self.assertIsNotNone(error)
+    self.assertEqual(error.message, (
+        "Package %s does not exist on device with serial %s."
+        % (TEST_PACKAGE_1, self.mock_device.serial)))
+    self.assertEqual(error.suggestion, (
+        "Select from one of the following packages on device with serial %s:"
+        " \n\t %s,\n\t %s" % (self.mock_device.serial, TEST_PACKAGE_2,
+                              TEST_PACKAGE_3)))
+    self.assertEqual(self.mock_device.start_package.call_count, 0)
+    self.assertEqual(self.mock_device.pull_file.call_count, 0)
+
+  def test_package_is_running_failure(self):
+    self.mock_device.is_package_running.return_value = True
+
+    error = self.command.execute(self.mock_device)
+
+    self.assertIsNotNone(error)
+    self.assertEqual(error.message, (
+        "Package %s is already running on device with serial %s."
+        % (TEST_PACKAGE_1, self.mock_device.serial)))
+    self.assertEqual(error.suggestion, (
+        "Run 'adb -s %s shell am force-stop %s' to close the package %s before"
+        " trying to start it."
+        % (self.mock_device.serial, TEST_PACKAGE_1, TEST_PACKAGE_1)))
+    self.assertEqual(self.mock_device.start_package.call_count, 0)
+    self.assertEqual(self.mock_device.pull_file.call_count, 0)
+
+  def test_force_stop_package_failure(self):
+    self.mock_device.start_package.return_value = None
+    self.mock_device.force_stop_package.side_effect = TEST_EXCEPTION
+
+    self.assert_execute_raises_test_error(0)
+    self.assertEqual(self.mock_device.start_package.call_count, 1)
+
+  def test_kill_pid_success(self):
+    self.mock_device.start_package.return_value = TEST_VALIDATION_ERROR
+
+    error = self.command.execute(self.mock_device)
+
+    self.assertIsNotNone(error)
+    self.assertEqual(error.message, TEST_ERROR_MSG)
+    self.assertIsNone(error.suggestion)
+    self.assertEqual(self.mock_device.start_package.call_count, 1)
+    self.assertEqual(self.mock_device.kill_pid.call_count, 1)
+    self.assertEqual(self.mock_device.pull_file.call_count, 0)
+
+  def test_kill_pid_failure(self):
+    self.mock_device.start_package.return_value = TEST_VALIDATION_ERROR
+    self.mock_device.kill_pid.side_effect = TEST_EXCEPTION
+
+    self.assert_execute_raises_test_error(0)
+    self.assertEqual(self.mock_device.start_package.call_count, 1)
+    self.assertEqual(self.mock_device.kill_pid.call_count, 1)
+
+
+if __name__ == '__main__':
+  unittest.main()
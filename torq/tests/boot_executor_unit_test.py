@@ -0,0 +1,79 @@
+#
+# Copyright (C) 2024 The Android Open Source Project
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+"""Unit tests for BootCommandExecutor."""
+
+import copy
+import unittest
+from tests.executor_test_common import (
+    ExecutorTestCase, FakeAdbDevice, ROOT_ONCE_THEN_FAIL, TEST_DURATION,
+    TEST_EXCEPTION, make_profiler_command)
+
+
+class BootCommandExecutorUnitTest(ExecutorTestCase):
+
+  @classmethod
+  def setUpClass(cls):
+    cls.command_template = make_profiler_command(
+        "boot", dur_ms=TEST_DURATION, between_dur_ms=TEST_DURATION)
+
+  def setUp(self):
+    self.command = copy.copy(self.command_template)
+    self.mock_device = FakeAdbDevice()
+
+  def test_execute_reboot_success(self):
+    error = self.command.execute(self.mock_device)
+
+    self.assertIsNone(error)
+    self.assertEqual(self.mock_device.reboot.call_count, 1)
+    self.assertEqual(self.mock_device.pull_file.call_count, 1)
+
+  def test_execute_reboot_multiple_runs_success(self):
+    self.command.runs = 5
+
+    error = self.command.execute(self.mock_device)
+
+    self.assertIsNone(error)
+    self.assertEqual(self.mock_device.reboot.call_count, 5)
+    self.assertEqual(self.mock_device.pull_file.call_count, 5)
+
+  def test_execute_device_method_failures(self):
+    # (failing device method, reboots performed before the failure aborts).
+    cases = (
+        ("reboot", 1),
+        ("write_to_file", 0),
+        ("remove_file", 0),
+        ("set_prop", 0),
+        ("wait_for_device", 1),
+        ("wait_for_boot_to_complete", 1),
+    )
+    for method_name, reboot_count in cases:
+      with self.subTest(method=method_name):
+        self.mock_device = FakeAdbDevice()
+        getattr(self.mock_device, method_name).side_effect = TEST_EXCEPTION
+
+        self.assert_execute_raises_test_error(0)
+        self.assertEqual(self.mock_device.reboot.call_count, reboot_count)
+
+  def test_execute_second_root_device_failure(self):
+    self.mock_device.root_device.side_effect = ROOT_ONCE_THEN_FAIL
+
+    self.assert_execute_raises_test_error(0)
+    self.assertEqual(self.mock_device.reboot.call_count, 1)
+
+
+if __name__ == '__main__':
+  unittest.main()
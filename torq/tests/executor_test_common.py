@@ -0,0 +1,157 @@
+#
+# Copyright (C) 2024 The Android Open Source Project
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+"""Shared helpers for the command executor unit tests.
+
+The executor TestCases are independent and purely mock-based (no real device
+or I/O), and live in one file per executor. When iterating locally they can
+be distributed across cores at file granularity, so each worker imports the
+torq modules once per file:
+
+  pytest -n auto --dist=loadfile tests/
+"""
+
+import unittest
+from unittest import mock
+from command import ProfilerCommand
+from device import AdbDevice
+from validation_error import ValidationError
+from torq import DEFAULT_DUR_MS, DEFAULT_OUT_DIR
+
+PROFILER_COMMAND_TYPE = "profiler"
+TEST_ERROR_MSG = "test-error"
+TEST_EXCEPTION = Exception(TEST_ERROR_MSG)
+TEST_VALIDATION_ERROR = ValidationError(TEST_ERROR_MSG, None)
+# Side effect for a root_device that succeeds on the first call and raises
+# on the second, e.g. the re-root after a reboot.
+ROOT_ONCE_THEN_FAIL = (None, TEST_EXCEPTION)
+TEST_SERIAL = "test-serial"
+DEFAULT_PERFETTO_CONFIG = "default"
+TEST_USER_ID_1 = 0
+TEST_USER_ID_2 = 1
+TEST_USER_ID_3 = 2
+TEST_PACKAGE_1 = "test-package-1"
+TEST_PACKAGE_2 = "test-package-2"
+TEST_PACKAGE_3 = "test-package-3"
+TEST_DURATION = 0
+
+# Ftrace events in the default config, shared by the two bad-ftrace-event
+# suggestion strings below.
+FTRACE_EVENTS = (
+    "dmabuf_heap/dma_heap_stat",
+    "ftrace/print",
+    "gpu_mem/gpu_mem_total",
+    "ion/ion_stat",
+    "kmem/ion_heap_grow",
+    "kmem/ion_heap_shrink",
+    "kmem/rss_stat",
+    "lowmemorykiller/lowmemory_kill",
+    "mm_event/mm_event_record",
+    "oom/mark_victim",
+    "oom/oom_score_adj_update",
+    "power/cpu_frequency",
+    "power/cpu_idle",
+    "power/gpu_frequency",
+    "power/suspend_resume",
+    "power/wakeup_source_activate",
+    "power/wakeup_source_deactivate",
+    "sched/sched_blocked_reason",
+    "sched/sched_process_exit",
+    "sched/sched_process_free",
+    "sched/sched_switch",
+    "sched/sched_wakeup",
+    "sched/sched_wakeup_new",
+    "sched/sched_waking",
+    "task/task_newtask",
+    "task/task_rename",
+    "vmscan/*",
+    "workqueue/*",
+)
+BAD_EXCLUDED_FTRACE_EVENT_SUGGESTION = (
+    "Please specify one of the following possible ftrace events:\n\t "
+    + "\n\t ".join(FTRACE_EVENTS))
+BAD_INCLUDED_FTRACE_EVENT_SUGGESTION = (
+    "Please do not specify any of the following ftrace events that are"
+    " already included:\n\t " + "\n\t ".join(FTRACE_EVENTS))
+
+# Public AdbDevice methods, collected once at import so constructing a stub
+# doesn't re-reflect over the class.
+ADB_DEVICE_METHODS = tuple(
+    name for name in dir(AdbDevice)
+    if not name.startswith("_") and callable(getattr(AdbDevice, name)))
+
+
+# Stand-in for command_executor.open_trace so no browser is launched. Built
+# once at import; patch it in with new= so tests skip per-call mock creation.
+MOCK_OPEN_TRACE = mock.MagicMock(name="open_trace")
+
+
+class FakeAdbDevice:
+  """Lightweight AdbDevice stand-in with a MagicMock per public method.
+
+  mock.create_autospec re-inspects the whole AdbDevice class on every
+  construction; attaching plain MagicMocks to a known method list is an order
+  of magnitude cheaper and still records calls and supports side effects.
+  """
+
+  # Slots skip the per-instance __dict__; the attribute set is fixed anyway,
+  # and tests construct one of these per scenario.
+  __slots__ = ADB_DEVICE_METHODS + ("serial",)
+
+  def __init__(self, serial=TEST_SERIAL):
+    self.serial = serial
+    for name in ADB_DEVICE_METHODS:
+      setattr(self, name, mock.MagicMock(name=name))
+    # A device whose connection check passes, matching what every test here
+    # previously configured on its autospec.
+    self.check_device_connection.return_value = None
+
+
+def make_profiler_command(event, **overrides):
+  """Build a ProfilerCommand with the defaults shared by these tests.
+
+  Keyword overrides replace individual arguments so each TestCase only spells
+  out what differs from the common case.
+  """
+  kwargs = dict(
+      type=PROFILER_COMMAND_TYPE, event=event, profiler=None,
+      out_dir=DEFAULT_OUT_DIR, dur_ms=DEFAULT_DUR_MS, app=None, runs=1,
+      simpleperf_event=None, perfetto_config=DEFAULT_PERFETTO_CONFIG,
+      between_dur_ms=None, ui=False, excluded_ftrace_events=None,
+      included_ftrace_events=None, from_user=None, to_user=None)
+  kwargs.update(overrides)
+  return ProfilerCommand(**kwargs)
+
+
+class ExecutorTestCase(unittest.TestCase):
+  """Shared assertions for the executor TestCases.
+
+  ProfilerCommand construction is identical for every test in a subclass, so
+  each subclass builds one command template in setUpClass and shallow-copies
+  it per test in setUp.
+  """
+
+  def assert_execute_raises_test_error(self, pull_file_count):
+    """Run the command expecting TEST_EXCEPTION to propagate.
+
+    pull_file_count states how many traces the executor pulled before the
+    failure, which pins down how far execution got.
+    """
+    with self.assertRaises(Exception) as e:
+      self.command.execute(self.mock_device)
+
+    self.assertEqual(str(e.exception), TEST_ERROR_MSG)
+    self.assertEqual(self.mock_device.pull_file.call_count, pull_file_count)
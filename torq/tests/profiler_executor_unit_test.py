@@ -0,0 +1,124 @@
+#
+# Copyright (C) 2024 The Android Open Source Project
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+"""Unit tests for ProfilerCommandExecutor."""
+
+import copy
+import unittest
+from unittest import mock
+from tests.executor_test_common import (
+    BAD_EXCLUDED_FTRACE_EVENT_SUGGESTION, BAD_INCLUDED_FTRACE_EVENT_SUGGESTION,
+    ExecutorTestCase, FakeAdbDevice, MOCK_OPEN_TRACE, TEST_EXCEPTION,
+    make_profiler_command)
+
+
+class ProfilerCommandExecutorUnitTest(ExecutorTestCase):
+
+  @classmethod
+  def setUpClass(cls):
+    cls.command_template = make_profiler_command("custom")
+
+  def setUp(self):
+    self.command = copy.copy(self.command_template)
+    self.mock_device = FakeAdbDevice()
+
+  @mock.patch("command_executor.open_trace", new=MOCK_OPEN_TRACE)
+  def test_execute_one_run_and_use_ui_success(self):
+    MOCK_OPEN_TRACE.reset_mock()
+    mock_process = mock.MagicMock()
+    self.command.use_ui = True
+    self.mock_device.start_perfetto_trace.return_value = mock_process
+
+    error = self.command.execute(self.mock_device)
+
+    self.assertIsNone(error)
+    self.assertEqual(self.mock_device.pull_file.call_count, 1)
+
+  def test_execute_one_run_no_ui_success(self):
+    mock_process = mock.MagicMock()
+    self.mock_device.start_perfetto_trace.return_value = mock_process
+
+    error = self.command.execute(self.mock_device)
+
+    self.assertIsNone(error)
+    self.assertEqual(self.mock_device.pull_file.call_count, 1)
+
+  def test_execute_device_method_failures(self):
+    # Any of these device calls failing must abort the run before a trace is
+    # pulled; the scenarios differ only in which method raises.
+    for method_name in ("check_device_connection", "root_device",
+                        "remove_file", "start_perfetto_trace"):
+      with self.subTest(method=method_name):
+        self.mock_device = FakeAdbDevice()
+        getattr(self.mock_device, method_name).side_effect = TEST_EXCEPTION
+
+        self.assert_execute_raises_test_error(0)
+
+  def test_execute_create_default_config_no_dur_ms_error(self):
+    self.command.dur_ms = None
+
+    with self.assertRaises(ValueError) as e:
+      self.command.execute(self.mock_device)
+
+    self.assertEqual(str(e.exception),
+                     "Cannot create config because a valid dur_ms was not set.")
+    self.assertEqual(self.mock_device.pull_file.call_count, 0)
+
+  def test_execute_create_default_config_bad_excluded_ftrace_event_error(self):
+    self.command.excluded_ftrace_events = ["mock-ftrace-event"]
+
+    error = self.command.execute(self.mock_device)
+
+    self.assertIsNotNone(error)
+    self.assertEqual(error.message,
+                     ("Cannot remove ftrace event %s from config because it is"
+                      " not one of the config's ftrace events."
+                      % self.command.excluded_ftrace_events[0]))
+    self.assertEqual(error.suggestion,
+                     BAD_EXCLUDED_FTRACE_EVENT_SUGGESTION)
+    self.assertEqual(self.mock_device.pull_file.call_count, 0)
+
+  def test_execute_create_default_config_bad_included_ftrace_event_error(self):
+    self.command.included_ftrace_events = ["power/cpu_idle"]
+
+    error = self.command.execute(self.mock_device)
+
+    self.assertIsNotNone(error)
+    self.assertEqual(error.message,
+                     ("Cannot add ftrace event %s to config because it is"
+                      " already one of the config's ftrace events."
+                      % self.command.included_ftrace_events[0]))
+    self.assertEqual(error.suggestion,
+                     BAD_INCLUDED_FTRACE_EVENT_SUGGESTION)
+    self.assertEqual(self.mock_device.pull_file.call_count, 0)
+
+  def test_execute_process_wait_failure(self):
+    mock_process = mock.MagicMock()
+    self.mock_device.start_perfetto_trace.return_value = mock_process
+    mock_process.wait.side_effect = TEST_EXCEPTION
+
+    self.assert_execute_raises_test_error(0)
+
+  def test_execute_pull_file_failure(self):
+    mock_process = mock.MagicMock()
+    self.mock_device.start_perfetto_trace.return_value = mock_process
+    self.mock_device.pull_file.side_effect = TEST_EXCEPTION
+
+    self.assert_execute_raises_test_error(1)
+
+
+if __name__ == '__main__':
+  unittest.main()
@@ -0,0 +1,145 @@
+#
+# Copyright (C) 2024 The Android Open Source Project
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+"""Unit tests for UserSwitchCommandExecutor."""
+
+import copy
+import unittest
+from unittest import mock
+from tests.executor_test_common import (
+    ExecutorTestCase, FakeAdbDevice, TEST_EXCEPTION, TEST_SERIAL,
+    TEST_USER_ID_1, TEST_USER_ID_2, TEST_USER_ID_3, make_profiler_command)
+
+
+class UserSwitchCommandExecutorUnitTest(ExecutorTestCase):
+
+  def simulate_user_switch(self, user):
+    self.current_user = user
+
+  @classmethod
+  def setUpClass(cls):
+    cls.command_template = make_profiler_command("user-switch")
+
+  def setUp(self):
+    self.command = copy.copy(self.command_template)
+    self.mock_device = FakeAdbDevice()
+    self.mock_device.user_exists.return_value = None
+    self.current_user = TEST_USER_ID_3
+    self.mock_device.get_current_user.side_effect = lambda: self.current_user
+
+  def test_execute_all_users_different_success(self):
+    mock_process = mock.MagicMock()
+    self.command.from_user = TEST_USER_ID_1
+    self.command.to_user = TEST_USER_ID_2
+    self.mock_device.start_perfetto_trace.return_value = mock_process
+    self.mock_device.perform_user_switch.side_effect = self.simulate_user_switch
+
+    error = self.command.execute(self.mock_device)
+
+    self.assertIsNone(error)
+    self.assertEqual(self.current_user, TEST_USER_ID_3)
+    self.assertEqual(self.mock_device.perform_user_switch.call_count, 3)
+    self.assertEqual(self.mock_device.pull_file.call_count, 1)
+
+  def test_execute_perform_user_switch_failure(self):
+    mock_process = mock.MagicMock()
+    self.command.from_user = TEST_USER_ID_2
+    self.command.to_user = TEST_USER_ID_1
+    self.mock_device.start_perfetto_trace.return_value = mock_process
+    self.mock_device.perform_user_switch.side_effect = TEST_EXCEPTION
+
+    self.assert_execute_raises_test_error(0)
+    self.assertEqual(self.mock_device.perform_user_switch.call_count, 1)
+
+  def test_execute_to_user_is_from_user_error(self):
+    self.command.from_user = TEST_USER_ID_1
+    self.command.to_user = TEST_USER_ID_1
+
+    error = self.command.execute(self.mock_device)
+
+    self.assertIsNotNone(error)
+    self.assertEqual(error.message, ("Cannot perform user-switch to user %s"
+                                     " because the current user on device"
+                                     " %s is already %s."
+                                     % (TEST_USER_ID_1, TEST_SERIAL,
+                                        TEST_USER_ID_1)))
+    self.assertEqual(error.suggestion, ("Choose a --to-user ID that is"
+                                        " different than the --from-user ID."))
+    self.assertEqual(self.mock_device.perform_user_switch.call_count, 0)
+    self.assertEqual(self.mock_device.pull_file.call_count, 0)
+
+  def test_execute_from_user_empty_success(self):
+    mock_process = mock.MagicMock()
+    self.command.from_user = None
+    self.command.to_user = TEST_USER_ID_2
+    self.mock_device.start_perfetto_trace.return_value = mock_process
+    self.mock_device.perform_user_switch.side_effect = self.simulate_user_switch
+
+    error = self.command.execute(self.mock_device)
+
+    self.assertIsNone(error)
+    self.assertEqual(self.current_user, TEST_USER_ID_3)
+    self.assertEqual(self.mock_device.perform_user_switch.call_count, 2)
+    self.assertEqual(self.mock_device.pull_file.call_count, 1)
+
+  def test_execute_to_user_is_current_user_and_from_user_empty_error(self):
+    self.command.from_user = None
+    self.command.to_user = self.current_user
+
+    error = self.command.execute(self.mock_device)
+
+    self.assertIsNotNone(error)
+    self.assertEqual(error.message, ("Cannot perform user-switch to user %s"
+                                     " because the current user on device"
+                                     " %s is already %s."
+                                     % (self.current_user, TEST_SERIAL,
+                                        self.current_user)))
+    self.assertEqual(error.suggestion, ("Choose a --to-user ID that is"
+                                        " different than the --from-user ID."))
+    self.assertEqual(self.mock_device.perform_user_switch.call_count, 0)
+    self.assertEqual(self.mock_device.pull_file.call_count, 0)
+
+  def test_execute_from_user_is_current_user_success(self):
+    mock_process = mock.MagicMock()
+    self.command.from_user = self.current_user
+    self.command.to_user = TEST_USER_ID_2
+    self.mock_device.start_perfetto_trace.return_value = mock_process
+    self.mock_device.perform_user_switch.side_effect = self.simulate_user_switch
+
+    error = self.command.execute(self.mock_device)
+
+    self.assertIsNone(error)
+    self.assertEqual(self.current_user, TEST_USER_ID_3)
+    self.assertEqual(self.mock_device.perform_user_switch.call_count, 2)
+    self.assertEqual(self.mock_device.pull_file.call_count, 1)
+
+  def test_execute_to_user_is_current_user_success(self):
+    mock_process = mock.MagicMock()
+    self.command.from_user = TEST_USER_ID_1
+    self.command.to_user = self.current_user
+    self.mock_device.start_perfetto_trace.return_value = mock_process
+    self.mock_device.perform_user_switch.side_effect = self.simulate_user_switch
+
+    error = self.command.execute(self.mock_device)
+
+    self.assertIsNone(error)
+    self.assertEqual(self.current_user, TEST_USER_ID_3)
+    self.assertEqual(self.mock_device.perform_user_switch.call_count, 2)
+    self.assertEqual(self.mock_device.pull_file.call_count, 1)
+
+
+if __name__ == '__main__':
+  unittest.main()